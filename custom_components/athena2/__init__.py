@@ -2,17 +2,23 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Coroutine
 import logging
+from typing import Any
 
 import aiohttp
-import async_timeout
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PORT,
+    EVENT_HOMEASSISTANT_CLOSE,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity_registry
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import config_validation as cv, entity_registry
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     CONF_SCAN_INTERVAL,
@@ -23,7 +29,6 @@ from .const import (
     ENDPOINT_PAUSE,
     ENDPOINT_REBOOT,
     ENDPOINT_SHUTDOWN,
-    ENDPOINT_START_PRINT,
     ENDPOINT_STOP,
     ENDPOINT_UNPAUSE,
     SERVICE_CANCEL_PRINT,
@@ -44,28 +49,150 @@ PLATFORMS: list[Platform] = [
     Platform.CAMERA,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-def _get_coordinator_from_call(hass: HomeAssistant, call: ServiceCall) -> Athena2Coordinator:
-    """Extract coordinator from service call target."""
-    # Services use entity targeting, extract device/entry from first entity
-    entity_id = call.data.get("entity_id")
-    if isinstance(entity_id, list) and entity_id:
-        entity_id = entity_id[0]
+# hass.data key for the entity_id -> config entry id lookup used by services
+DATA_ENTITY_ENTRIES = f"{DOMAIN}_entity_entries"
 
-    if not entity_id:
-        raise HomeAssistantError("No entity specified for service call")
 
-    # Get entry_id from entity registry
-    entity_reg = entity_registry.async_get(hass)
-    entity_entry = entity_reg.async_get(entity_id)
+def _get_coordinators_from_call(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[Athena2Coordinator]:
+    """Extract the coordinators of all targeted entities from a service call."""
+    entity_ids = call.data.get("entity_id")
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
 
-    if not entity_entry:
-        raise HomeAssistantError(f"Entity {entity_id} not found")
+    if not entity_ids:
+        raise HomeAssistantError("No entity specified for service call")
 
-    if entity_entry.config_entry_id not in hass.data.get(DOMAIN, {}):
-        raise HomeAssistantError("Athena II device not found")
+    entity_entries: dict[str, str | None] = hass.data.setdefault(DATA_ENTITY_ENTRIES, {})
+    coordinators: dict[str, Athena2Coordinator] = {}
+    for entity_id in entity_ids:
+        if entity_id in entity_entries:
+            entry_id = entity_entries[entity_id]
+        else:
+            # Get entry_id from entity registry and remember it
+            entity_entry = entity_registry.async_get(hass).async_get(entity_id)
+            if not entity_entry:
+                raise HomeAssistantError(f"Entity {entity_id} not found")
+            entry_id = entity_entries[entity_id] = entity_entry.config_entry_id
+
+        if entry_id not in hass.data.get(DOMAIN, {}):
+            raise HomeAssistantError("Athena II device not found")
+
+        # Several entities of the same printer still result in a single call
+        coordinators[entry_id] = hass.data[DOMAIN][entry_id]
+
+    return list(coordinators.values())
+
+
+def _auto_shutdown_url(coordinator: Athena2Coordinator, call: ServiceCall) -> str:
+    """Pick the auto shutdown URL from the service call data."""
+    if call.data.get("enabled", False):
+        return coordinator.urls[ENDPOINT_AUTO_SHUTDOWN_ENABLE]
+    return coordinator.urls[ENDPOINT_AUTO_SHUTDOWN_DISABLE]
+
+
+def _start_print_url(coordinator: Athena2Coordinator, call: ServiceCall) -> str:
+    """Build the start print URL from the service call data."""
+    plate_id = call.data.get("plate_id")
+    if not plate_id:
+        raise HomeAssistantError("plate_id parameter is required")
+    return f"{coordinator.start_print_base}{plate_id}"
+
+
+# Service name -> (endpoint or URL builder, action for log messages, refresh afterwards)
+SERVICE_TABLE: dict[
+    str, tuple[str | Callable[[Athena2Coordinator, ServiceCall], str], str, bool]
+] = {
+    SERVICE_PAUSE_PRINT: (ENDPOINT_PAUSE, "pause print", True),
+    SERVICE_RESUME_PRINT: (ENDPOINT_UNPAUSE, "resume print", True),
+    SERVICE_CANCEL_PRINT: (ENDPOINT_STOP, "cancel print", True),
+    SERVICE_SET_AUTO_SHUTDOWN: (_auto_shutdown_url, "set auto shutdown", True),
+    SERVICE_START_PRINT: (_start_print_url, "start print", True),
+    SERVICE_SHUTDOWN: (ENDPOINT_SHUTDOWN, "shutdown printer", False),
+    SERVICE_REBOOT: (ENDPOINT_REBOOT, "reboot printer", False),
+}
+
+
+async def _do_printer_call(
+    coordinator: Athena2Coordinator, url: str, action: str, refresh: bool
+) -> None:
+    """Call a printer control endpoint and optionally refresh the coordinator."""
+    try:
+        async with asyncio.timeout(10):
+            async with coordinator.session.get(url) as response:
+                response.raise_for_status()
+            _LOGGER.info("Request to %s succeeded", action)
+            if refresh:
+                await coordinator.async_request_refresh()
+    except asyncio.TimeoutError:
+        _LOGGER.error("Timeout trying to %s", action)
+        raise HomeAssistantError("Timeout connecting to printer")
+    except aiohttp.ClientError as err:
+        _LOGGER.error("Failed to %s: %s", action, err)
+        raise HomeAssistantError(f"Failed to {action}: {err}")
+
+
+def _make_service_handler(
+    hass: HomeAssistant,
+    endpoint: str | Callable[[Athena2Coordinator, ServiceCall], str],
+    action: str,
+    refresh: bool,
+) -> Callable[[ServiceCall], Coroutine[Any, Any, None]]:
+    """Build the service handler for one SERVICE_TABLE entry."""
+
+    async def async_handle_service(call: ServiceCall) -> None:
+        """Handle a printer control service call."""
+        targets: list[tuple[Athena2Coordinator, str]] = []
+        for coordinator in _get_coordinators_from_call(hass, call):
+            if callable(endpoint):
+                url = endpoint(coordinator, call)
+            else:
+                url = coordinator.urls[endpoint]
+            targets.append((coordinator, url))
+
+        # Call all targeted printers concurrently, then surface the first failure
+        results = await asyncio.gather(
+            *(
+                _do_printer_call(coordinator, url, action, refresh)
+                for coordinator, url in targets
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    return async_handle_service
+
+
+def register_services(hass: HomeAssistant) -> None:
+    """Register the printer control services, shared across all devices."""
+    for service, (endpoint, action, refresh) in SERVICE_TABLE.items():
+        hass.services.async_register(
+            DOMAIN, service, _make_service_handler(hass, endpoint, action, refresh)
+        )
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Athena II integration."""
+    entity_entries: dict[str, str | None] = hass.data.setdefault(DATA_ENTITY_ENTRIES, {})
+
+    @callback
+    def _async_registry_updated(event: Event) -> None:
+        """Forget cached lookups for renamed or removed entities."""
+        entity_entries.pop(event.data["entity_id"], None)
+        if old_entity_id := event.data.get("old_entity_id"):
+            entity_entries.pop(old_entity_id, None)
+
+    hass.bus.async_listen(
+        entity_registry.EVENT_ENTITY_REGISTRY_UPDATED, _async_registry_updated
+    )
 
-    return hass.data[DOMAIN][entity_entry.config_entry_id]
+    register_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -77,18 +204,37 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
     )
 
-    session = async_get_clientsession(hass)
+    # Dedicated session so connections to the printer stay warm between polls
+    # (keepalive outlives the scan interval instead of HA's shared 15s default,
+    # and is requested explicitly in case the printer answers with HTTP/1.0)
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=8, keepalive_timeout=75),
+        headers={"Connection": "keep-alive"},
+    )
 
     coordinator = Athena2Coordinator(
         hass=hass,
         session=session,
+        entry_id=entry.entry_id,
         host=host,
         port=port,
         scan_interval=scan_interval,
     )
 
     # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await session.close()
+        raise
+
+    async def _async_close_session(event: Event) -> None:
+        """Close the session when HA stops, as entries aren't unloaded then."""
+        await session.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -96,153 +242,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register services (only once, shared across all devices)
-    async def async_pause_print(call: ServiceCall) -> None:
-        """Handle pause print service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        url = f"http://{coordinator.host}:{coordinator.port}{ENDPOINT_PAUSE}"
-
-        try:
-            async with async_timeout.timeout(10):
-                response = await coordinator.session.get(url)
-                response.raise_for_status()
-                _LOGGER.info("Print paused successfully")
-                await coordinator.async_request_refresh()
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout pausing print")
-            raise HomeAssistantError("Timeout connecting to printer")
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Failed to pause print: %s", err)
-            raise HomeAssistantError(f"Failed to pause print: {err}")
-
-    async def async_resume_print(call: ServiceCall) -> None:
-        """Handle resume print service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        url = f"http://{coordinator.host}:{coordinator.port}{ENDPOINT_UNPAUSE}"
-
-        try:
-            async with async_timeout.timeout(10):
-                response = await coordinator.session.get(url)
-                response.raise_for_status()
-                _LOGGER.info("Print resumed successfully")
-                await coordinator.async_request_refresh()
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout resuming print")
-            raise HomeAssistantError("Timeout connecting to printer")
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Failed to resume print: %s", err)
-            raise HomeAssistantError(f"Failed to resume print: {err}")
-
-    async def async_cancel_print(call: ServiceCall) -> None:
-        """Handle cancel print service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        url = f"http://{coordinator.host}:{coordinator.port}{ENDPOINT_STOP}"
-
-        try:
-            async with async_timeout.timeout(10):
-                response = await coordinator.session.get(url)
-                response.raise_for_status()
-                _LOGGER.info("Print cancelled successfully")
-                await coordinator.async_request_refresh()
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout cancelling print")
-            raise HomeAssistantError("Timeout connecting to printer")
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Failed to cancel print: %s", err)
-            raise HomeAssistantError(f"Failed to cancel print: {err}")
-
-    async def async_set_auto_shutdown(call: ServiceCall) -> None:
-        """Handle set auto shutdown service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        enabled = call.data.get("enabled", False)
-        endpoint = ENDPOINT_AUTO_SHUTDOWN_ENABLE if enabled else ENDPOINT_AUTO_SHUTDOWN_DISABLE
-        url = f"http://{coordinator.host}:{coordinator.port}{endpoint}"
-
-        try:
-            async with async_timeout.timeout(10):
-                response = await coordinator.session.get(url)
-                response.raise_for_status()
-                _LOGGER.info("Auto shutdown %s successfully", "enabled" if enabled else "disabled")
-                await coordinator.async_request_refresh()
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout setting auto shutdown")
-            raise HomeAssistantError("Timeout connecting to printer")
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Failed to set auto shutdown: %s", err)
-            raise HomeAssistantError(f"Failed to set auto shutdown: {err}")
-
-    async def async_start_print(call: ServiceCall) -> None:
-        """Handle start print service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        plate_id = call.data.get("plate_id")
-        if not plate_id:
-            raise HomeAssistantError("plate_id parameter is required")
-
-        url = f"http://{coordinator.host}:{coordinator.port}{ENDPOINT_START_PRINT}{plate_id}"
-
-        try:
-            async with async_timeout.timeout(10):
-                response = await coordinator.session.get(url)
-                response.raise_for_status()
-                _LOGGER.info("Print started successfully for plate_id: %s", plate_id)
-                await coordinator.async_request_refresh()
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout starting print")
-            raise HomeAssistantError("Timeout connecting to printer")
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Failed to start print: %s", err)
-            raise HomeAssistantError(f"Failed to start print: {err}")
-
-    async def async_shutdown(call: ServiceCall) -> None:
-        """Handle shutdown service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        url = f"http://{coordinator.host}:{coordinator.port}{ENDPOINT_SHUTDOWN}"
-
-        try:
-            async with async_timeout.timeout(10):
-                response = await coordinator.session.get(url)
-                response.raise_for_status()
-                _LOGGER.info("Printer shutdown initiated successfully")
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout shutting down printer")
-            raise HomeAssistantError("Timeout connecting to printer")
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Failed to shutdown printer: %s", err)
-            raise HomeAssistantError(f"Failed to shutdown printer: {err}")
-
-    async def async_reboot(call: ServiceCall) -> None:
-        """Handle reboot service call."""
-        coordinator = _get_coordinator_from_call(hass, call)
-        url = f"http://{coordinator.host}:{coordinator.port}{ENDPOINT_REBOOT}"
-
-        try:
-            async with async_timeout.timeout(10):
-                response = await coordinator.session.get(url)
-                response.raise_for_status()
-                _LOGGER.info("Printer reboot initiated successfully")
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout rebooting printer")
-            raise HomeAssistantError("Timeout connecting to printer")
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Failed to reboot printer: %s", err)
-            raise HomeAssistantError(f"Failed to reboot printer: {err}")
-
-    # Register services only if not already registered
-    if not hass.services.has_service(DOMAIN, SERVICE_PAUSE_PRINT):
-        hass.services.async_register(DOMAIN, SERVICE_PAUSE_PRINT, async_pause_print)
-    if not hass.services.has_service(DOMAIN, SERVICE_RESUME_PRINT):
-        hass.services.async_register(DOMAIN, SERVICE_RESUME_PRINT, async_resume_print)
-    if not hass.services.has_service(DOMAIN, SERVICE_CANCEL_PRINT):
-        hass.services.async_register(DOMAIN, SERVICE_CANCEL_PRINT, async_cancel_print)
-    if not hass.services.has_service(DOMAIN, SERVICE_SET_AUTO_SHUTDOWN):
-        hass.services.async_register(DOMAIN, SERVICE_SET_AUTO_SHUTDOWN, async_set_auto_shutdown)
-    if not hass.services.has_service(DOMAIN, SERVICE_START_PRINT):
-        hass.services.async_register(DOMAIN, SERVICE_START_PRINT, async_start_print)
-    if not hass.services.has_service(DOMAIN, SERVICE_SHUTDOWN):
-        hass.services.async_register(DOMAIN, SERVICE_SHUTDOWN, async_shutdown)
-    if not hass.services.has_service(DOMAIN, SERVICE_REBOOT):
-        hass.services.async_register(DOMAIN, SERVICE_REBOOT, async_reboot)
-
     # Register update listener for options changes
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
@@ -252,17 +251,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
-
-        # Unregister services only if this is the last Athena II device
-        if not hass.data[DOMAIN]:
-            hass.services.async_remove(DOMAIN, SERVICE_PAUSE_PRINT)
-            hass.services.async_remove(DOMAIN, SERVICE_RESUME_PRINT)
-            hass.services.async_remove(DOMAIN, SERVICE_CANCEL_PRINT)
-            hass.services.async_remove(DOMAIN, SERVICE_SET_AUTO_SHUTDOWN)
-            hass.services.async_remove(DOMAIN, SERVICE_START_PRINT)
-            hass.services.async_remove(DOMAIN, SERVICE_SHUTDOWN)
-            hass.services.async_remove(DOMAIN, SERVICE_REBOOT)
+        coordinator: Athena2Coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.session.close()
 
     return unload_ok
 
@@ -2,18 +2,22 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+from collections.abc import AsyncIterator
 import io
 import logging
+import re
+import struct
+from typing import TYPE_CHECKING
 
 import aiohttp
-import async_timeout
-from PIL import Image
 
 from homeassistant.components.camera import Camera
+from homeassistant.components.camera.img_util import (
+    TurboJPEGSingleton,
+    find_supported_scaling_factor,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
@@ -21,12 +25,164 @@ from .const import (
     DEFAULT_CAMERA_FPS,
     DOMAIN,
     ENDPOINT_CAMERA,
-    MANUFACTURER,
-    MODEL,
 )
 
+if TYPE_CHECKING:
+    from turbojpeg import TurboJPEG
+
 _LOGGER = logging.getLogger(__name__)
 
+# JPEG markers
+_SOI = b"\xff\xd8"
+_EOI = b"\xff\xd9"
+_APP0 = b"\xff\xe0"
+_APP1 = b"\xff\xe1"
+_EXIF_HEADER = b"Exif\x00\x00"
+
+# Part header announcing the JPEG size; the line ending guards against a split number
+_CONTENT_LENGTH_RE = re.compile(rb"Content-Length:\s*(\d+)\r?\n", re.IGNORECASE)
+
+# Most bytes buffered while hunting for a frame in an MJPEG stream
+_FRAME_BUFFER_SIZE = 2 * 1024 * 1024
+
+# Seconds the multipart reader gets to produce one part before the marker scan takes over
+_MULTIPART_READ_TIMEOUT = 5
+
+# EXIF APP1 segment carrying only Orientation=6 ("rotate 90° clockwise to display")
+_EXIF_TIFF = b"MM\x00\x2a" + struct.pack(">IHHHIHHI", 8, 1, 0x0112, 3, 1, 6, 0, 0)
+EXIF_ROT90: bytes = (
+    _APP1
+    + struct.pack(">H", 2 + len(_EXIF_HEADER) + len(_EXIF_TIFF))
+    + _EXIF_HEADER
+    + _EXIF_TIFF
+)
+
+
+def _detect_boundary(line: bytes) -> bytes | None:
+    """Return the multipart boundary token if a line is a "--token" delimiter."""
+    if not line.startswith(b"--"):
+        return None
+    return line[2:].strip() or None
+
+
+async def _prepend(
+    head: bytes, chunks: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    """Yield head (if any) before the chunks of a stream."""
+    if head:
+        yield head
+    async for chunk in chunks:
+        yield chunk
+
+
+def _tag_rotated(image_data: bytes) -> bytes | None:
+    """Splice an EXIF orientation tag into a JPEG so viewers rotate it on display.
+
+    Returns None if the frame can't be tagged without pixel work (not a JPEG,
+    or its own EXIF segment has no upright Orientation tag to rewrite).
+    """
+    if not image_data.startswith(_SOI):
+        return None
+
+    offset = 2
+    # JFIF requires APP0 to directly follow SOI, so insert after it
+    if image_data[2:4] == _APP0:
+        (length,) = struct.unpack_from(">H", image_data, 4)
+        offset = 4 + length
+
+    if (
+        image_data[offset:offset + 2] == _APP1
+        and image_data[offset + 4:offset + 10] == _EXIF_HEADER
+    ):
+        return _rewrite_exif_orientation(image_data, offset)
+
+    return image_data[:offset] + EXIF_ROT90 + image_data[offset:]
+
+
+def _rewrite_exif_orientation(image_data: bytes, app1: int) -> bytes | None:
+    """Set Orientation=6 in the frame's own EXIF segment, touching only that tag."""
+    try:
+        (length,) = struct.unpack_from(">H", image_data, app1 + 2)
+        segment_end = app1 + 2 + length
+        tiff = app1 + 10
+
+        byte_order = image_data[tiff:tiff + 2]
+        if byte_order == b"MM":
+            endian = ">"
+        elif byte_order == b"II":
+            endian = "<"
+        else:
+            return None
+
+        (ifd_offset,) = struct.unpack_from(f"{endian}I", image_data, tiff + 4)
+        ifd = tiff + ifd_offset
+        (count,) = struct.unpack_from(f"{endian}H", image_data, ifd)
+        for entry in range(ifd + 2, min(ifd + 2 + count * 12, segment_end - 11), 12):
+            tag, value_type, _, value = struct.unpack_from(
+                f"{endian}HHIH", image_data, entry
+            )
+            if tag != 0x0112:
+                continue
+            # Only an upright frame can simply be relabelled as rotated
+            if value_type != 3 or value != 1:
+                return None
+            patched = bytearray(image_data)
+            struct.pack_into(f"{endian}H", patched, entry + 8, 6)
+            return bytes(patched)
+    except struct.error:
+        pass
+
+    return None
+
+
+def _rotate_jpeg(data: bytes, size: tuple[int, int] | None = None) -> bytes:
+    """Rotate a JPEG 90° clockwise by re-encoding it (blocking).
+
+    With a (width, height) hint the frame is decoded at the smallest libjpeg
+    DCT scale that still covers it, instead of full size.
+    """
+    if turbo_jpeg := TurboJPEGSingleton.instance():
+        return _rotate_jpeg_turbo(turbo_jpeg, data, size)
+    return _rotate_jpeg_pillow(data, size)
+
+
+def _rotate_jpeg_turbo(
+    turbo_jpeg: TurboJPEG, data: bytes, size: tuple[int, int] | None
+) -> bytes:
+    """Rotate a JPEG with libjpeg-turbo's SIMD codec and a NumPy view."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    scaling_factor = None
+    if size is not None:
+        # The hint is for the rotated output, so swap the axes for the source
+        src_width, src_height, _, _ = turbo_jpeg.decode_header(data)
+        scaling_factor = find_supported_scaling_factor(
+            src_width, src_height, size[1], size[0]
+        )
+
+    pixels = turbo_jpeg.decode(data, scaling_factor=scaling_factor)
+    # rot90 only swaps strides; the single copy happens when making it contiguous
+    rotated = np.ascontiguousarray(np.rot90(pixels, k=-1))
+    return turbo_jpeg.encode(rotated, quality=85)
+
+
+def _rotate_jpeg_pillow(data: bytes, size: tuple[int, int] | None) -> bytes:
+    """Rotate a JPEG with Pillow, used when libturbojpeg can't be loaded."""
+    # Only needed without libturbojpeg, so load Pillow on demand
+    from PIL import Image  # pylint: disable=import-outside-toplevel
+
+    image = Image.open(io.BytesIO(data))
+    if size is not None:
+        image.draft("RGB", (size[1], size[0]))
+    rotated = image.transpose(Image.Transpose.ROTATE_270)  # 270° CCW = 90° CW
+    # Release the source pixels before the rotated copy is encoded
+    image.close()
+
+    output = io.BytesIO()
+    rotated.save(output, format="JPEG", quality=85)
+    # getvalue() hands over BytesIO's internal buffer without another copy
+    return output.getvalue()
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,7 +191,6 @@ async def async_setup_entry(
 ) -> None:
     """Set up Athena II camera based on a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    session = async_get_clientsession(hass)
 
     # Get camera FPS from options or config
     camera_fps = entry.options.get(
@@ -43,7 +198,7 @@ async def async_setup_entry(
         entry.data.get(CONF_CAMERA_FPS, DEFAULT_CAMERA_FPS),
     )
 
-    async_add_entities([Athena2Camera(coordinator, entry, session, camera_fps)])
+    async_add_entities([Athena2Camera(coordinator, entry, coordinator.session, camera_fps)])
 
 
 class Athena2Camera(Camera):
@@ -66,16 +221,20 @@ class Athena2Camera(Camera):
         self._camera_fps = camera_fps
         self._frame_interval = 1.0 / camera_fps  # Time between frames in seconds
         self._last_frame_time = 0
-        self._last_image = None
+        self._last_frame: bytes | None = None
+        self._last_image: bytes | None = None
+        self._scaled_images: dict[tuple[int, int], bytes] = {}
+        self._inflight: asyncio.Task[None] | None = None
         self._attr_unique_id = f"{entry.entry_id}_camera"
         self._stream_url = f"http://{coordinator.host}:{coordinator.port}{ENDPOINT_CAMERA}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": f"Athena II ({coordinator.host})",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": coordinator.data.get("Version") if coordinator.data else None,
-        }
+        self._snapshot_url: str | None = None
+        self._snapshot_probed = False
+        self._boundary: bytes | None = None
+        self._multipart_ok = True
+        # Fetches are coalesced, so one extractor at a time writes into this;
+        # allocated on first use, as only streams without usable framing need it
+        self._frame_buf: bytearray | None = None
+        self._attr_device_info = coordinator.device_info
         self._attr_frame_interval = self._frame_interval
 
         _LOGGER.info(
@@ -88,106 +247,253 @@ class Athena2Camera(Camera):
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return a rotated camera image with rate limiting."""
-        current_time = datetime.now().timestamp()
-
-        # Check if enough time has passed since last frame
-        time_since_last_frame = current_time - self._last_frame_time
+        time_since_last_frame = None
+        if self._last_image is not None:
+            time_since_last_frame = self.hass.loop.time() - self._last_frame_time
 
-        if time_since_last_frame < self._frame_interval and self._last_image is not None:
+        if time_since_last_frame is not None and time_since_last_frame < self._frame_interval:
             # Return cached image if we're fetching too fast
-            _LOGGER.debug(
-                "Returning cached image (%.2fs since last fetch, interval is %.2fs)",
-                time_since_last_frame,
-                self._frame_interval,
-            )
-            return self._last_image
-
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Returning cached image (%.2fs since last fetch, interval is %.2fs)",
+                    time_since_last_frame,
+                    self._frame_interval,
+                )
+        else:
+            # Share a fetch that is already running instead of starting another one
+            if self._inflight is None or self._inflight.done():
+                self._inflight = self.hass.async_create_task(self._async_fetch_image())
+            # A caller going away must not cancel the fetch the others wait on
+            await asyncio.shield(self._inflight)
+
+        if width and height and self._last_frame is not None:
+            return await self._async_scaled_image(width, height)
+        return self._last_image
+
+    async def _async_fetch_image(self) -> None:
+        """Fetch, rotate and cache a new camera image, keeping the old one on failure."""
+        current_time = self.hass.loop.time()
         try:
-            async with async_timeout.timeout(15):
-                response = await self._session.get(self._stream_url)
-                response.raise_for_status()
-
-                # Extract first frame from MJPEG stream
-                image_data = await self._extract_mjpeg_frame(response)
+            async with asyncio.timeout(15):
+                image_data = await self._fetch_frame()
 
                 if not image_data:
                     _LOGGER.warning("No image data extracted from MJPEG stream")
-                    return self._last_image  # Return cached image on failure
+                    return
 
-                _LOGGER.debug("Processing JPEG image of %d bytes", len(image_data))
+                if image_data == self._last_frame:
+                    # Idle printers send identical frames; keep the rotated results
+                    self._last_frame_time = current_time
+                    return
 
-                # Rotate image 90° clockwise
-                image = Image.open(io.BytesIO(image_data))
-                rotated = image.rotate(-90, expand=True)  # -90 = clockwise rotation
+                _LOGGER.debug("Processing JPEG image of %d bytes", len(image_data))
 
-                # Convert back to bytes
-                output = io.BytesIO()
-                rotated.save(output, format="JPEG", quality=85)
-                rotated_bytes = output.getvalue()
+                # Rotate image 90° clockwise, preferably by tagging it instead of re-encoding
+                rotated_bytes = _tag_rotated(image_data)
+                if rotated_bytes is None:
+                    rotated_bytes = await self.hass.async_add_executor_job(
+                        _rotate_jpeg, image_data
+                    )
 
-                # Cache the image and timestamp
+                # Cache the frame, image and timestamp
+                self._last_frame = image_data
                 self._last_image = rotated_bytes
+                self._scaled_images = {}
                 self._last_frame_time = current_time
 
-                return rotated_bytes
-
         except asyncio.TimeoutError:
             _LOGGER.error("Timeout getting camera image from %s", self._stream_url)
-            return self._last_image  # Return cached image on timeout
         except aiohttp.ClientError as err:
             _LOGGER.error("Error getting camera image: %s", err)
-            return self._last_image
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.error("Unexpected error processing camera image: %s", err)
+        finally:
+            self._inflight = None
+
+    async def _async_scaled_image(self, width: int, height: int) -> bytes | None:
+        """Return the current frame rotated and reduced for a width/height hint."""
+        size = (width, height)
+        if (image := self._scaled_images.get(size)) is not None:
+            return image
+
+        # HA rescales sized requests itself and drops the EXIF tag on the way,
+        # so these get real pixel rotation from a cheaply downscaled decode
+        frame = self._last_frame
+        try:
+            image = await self.hass.async_add_executor_job(_rotate_jpeg, frame, size)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Unexpected error scaling camera image: %s", err)
             return self._last_image
 
-    async def _extract_mjpeg_frame(self, response: aiohttp.ClientResponse) -> bytes | None:
+        if frame is self._last_frame:
+            self._scaled_images[size] = image
+        return image
+
+    async def _fetch_frame(self) -> bytes | None:
+        """Fetch a single JPEG frame, preferring a snapshot URL over the stream."""
+        if not self._snapshot_probed:
+            # Probe once for an mjpg-streamer style single-frame snapshot
+            self._snapshot_probed = True
+            probe_url = f"{self._stream_url}?action=snapshot"
+            async with self._session.get(probe_url) as response:
+                if response.ok and response.content_type == "image/jpeg":
+                    _LOGGER.debug("Using snapshot URL %s", probe_url)
+                    self._snapshot_url = probe_url
+                    return await response.read()
+                if response.ok and response.content_type.startswith("multipart/"):
+                    # Query ignored and we got the stream itself; use it for this frame
+                    return await self._read_mjpeg_frame(response)
+
+        # Leaving the context releases the connection instead of waiting for GC
+        if self._snapshot_url is not None:
+            async with self._session.get(self._snapshot_url) as response:
+                response.raise_for_status()
+                return await response.read()
+
+        async with self._session.get(self._stream_url) as response:
+            response.raise_for_status()
+            return await self._read_mjpeg_frame(response)
+
+    async def _read_mjpeg_frame(self, response: aiohttp.ClientResponse) -> bytes | None:
+        """Read the first part of a multipart MJPEG stream."""
+        if not self._multipart_ok or not response.content_type.startswith("multipart/"):
+            return await self._extract_mjpeg_frame(response)
+
+        try:
+            reader = aiohttp.MultipartReader.from_response(response)
+        except (KeyError, ValueError):
+            # Content-Type doesn't name the boundary, sniff it from the body
+            return await self._read_sniffed_part(response)
+
+        # Only the first part is needed; the stream itself never ends, so the
+        # reader is not drained and the response is dropped instead. Framing
+        # the reader can't follow (a wrong boundary, or no CRLF before the next
+        # one) never reaches EOF on a live stream, so bound it in time and size
+        try:
+            async with asyncio.timeout(_MULTIPART_READ_TIMEOUT):
+                part = await reader.next()
+                if part is None:
+                    return None
+                frame = bytearray()
+                while chunk := await part.read_chunk():
+                    frame += chunk
+                    if len(frame) > _FRAME_BUFFER_SIZE:
+                        raise ValueError("Multipart part exceeded 2MB")
+                return bytes(frame)
+        except (TimeoutError, ValueError, AssertionError) as err:
+            # Framing that doesn't match its header; stop using the reader
+            _LOGGER.debug("Falling back to JPEG marker scan: %s", err or "read timed out")
+            self._multipart_ok = False
+
+        # The failed read consumed part of this stream, so scan a fresh one
+        async with self._session.get(self._stream_url) as response:
+            response.raise_for_status()
+            return await self._extract_mjpeg_frame(response)
+
+    async def _read_sniffed_part(self, response: aiohttp.ClientResponse) -> bytes | None:
+        """Read the first part of a stream whose boundary isn't in Content-Type."""
+        content = response.content
+        try:
+            line = await content.readline()
+            while line in (b"\r\n", b"\n"):  # Skip blank preamble lines
+                line = await content.readline()
+
+            # Later frames only need to confirm the boundary seen on the first one
+            if self._boundary is None or line.strip() != b"--" + self._boundary:
+                if (boundary := _detect_boundary(line)) is None:
+                    # No multipart framing at all, look for JPEG markers instead
+                    return await self._extract_mjpeg_frame(response, line)
+                _LOGGER.debug("Detected MJPEG boundary %r", boundary)
+                self._boundary = boundary
+
+            content_length = None
+            while (line := await content.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    content_length = int(value)
+
+            if content_length is None or content_length > _FRAME_BUFFER_SIZE:
+                # No usable length, so the frame ends where its markers say
+                return await self._extract_mjpeg_frame(response)
+
+            jpeg_data = await content.readexactly(content_length)
+        except (ValueError, asyncio.IncompleteReadError) as err:
+            _LOGGER.error("Error reading MJPEG part: %s", err)
+            return None
+
+        if jpeg_data.startswith(_SOI):
+            if jpeg_data.endswith(_EOI):
+                return jpeg_data
+            # A length that also counts the part's trailing CRLF, for instance
+            if (jpeg_end := jpeg_data.rfind(_EOI)) != -1:
+                return jpeg_data[:jpeg_end + 2]
+
+        # Length didn't line up with the frame, keep scanning from what was read
+        _LOGGER.debug("MJPEG part of %d bytes is not a complete JPEG", content_length)
+        return await self._extract_mjpeg_frame(response, jpeg_data)
+
+    async def _extract_mjpeg_frame(
+        self, response: aiohttp.ClientResponse, preamble: bytes = b""
+    ) -> bytes | None:
         """Extract a single frame from MJPEG stream."""
         try:
-            # Read stream until we find a complete JPEG frame
-            buffer = b""
+            # Read stream until we find a complete JPEG frame, reusing the
+            # camera's buffer; bytes past `length` are leftovers from earlier frames
+            if (buffer := self._frame_buf) is None:
+                buffer = self._frame_buf = bytearray(_FRAME_BUFFER_SIZE)
+            view = memoryview(buffer)
+            length = 0
             content_length = None
-            in_jpeg = False
+            header_scan_from = 0
+            jpeg_start = -1
+            scan_from = 0  # Only bytes past this offset still need searching
 
-            async for chunk in response.content.iter_chunked(4096):
-                buffer += chunk
+            async for chunk in _prepend(preamble, response.content.iter_chunked(65536)):
+                # Prevent buffer from growing too large
+                end = length + len(chunk)
+                if end > _FRAME_BUFFER_SIZE:
+                    _LOGGER.warning("Buffer exceeded 2MB without finding complete frame")
+                    break
+                view[length:end] = chunk
+                length = end
 
                 # Look for Content-Length header in stream
-                if not in_jpeg and b"Content-Length:" in buffer:
-                    try:
-                        length_line = buffer.split(b"Content-Length:")[1].split(b"\r\n")[0]
-                        content_length = int(length_line.strip())
-                    except (ValueError, IndexError):
-                        pass
+                if jpeg_start == -1 and content_length is None:
+                    if match := _CONTENT_LENGTH_RE.search(buffer, header_scan_from, length):
+                        content_length = int(match.group(1))
+                    else:
+                        # Overlap enough to catch a header split across chunks
+                        header_scan_from = max(0, length - 32)
 
                 # Look for JPEG start (FFD8) marker
-                if not in_jpeg:
-                    jpeg_start = buffer.find(b"\xff\xd8")
+                if jpeg_start == -1:
+                    jpeg_start = buffer.find(_SOI, scan_from, length)
                     if jpeg_start != -1:
-                        in_jpeg = True
-                        # Keep only from JPEG start
-                        buffer = buffer[jpeg_start:]
+                        scan_from = jpeg_start + 2
+
+                # With a known length the frame can be cut without scanning for FFD9
+                if jpeg_start != -1 and content_length is not None:
+                    jpeg_end = jpeg_start + content_length
+                    if length >= jpeg_end:
+                        if buffer[jpeg_end - 2:jpeg_end] == _EOI:
+                            jpeg_data = bytes(view[jpeg_start:jpeg_end])
+                            _LOGGER.debug("Extracted JPEG frame of %d bytes", len(jpeg_data))
+                            return jpeg_data
+                        # Length didn't line up with the markers, fall back to scanning
+                        content_length = None
 
                 # Look for JPEG end (FFD9) marker
-                if in_jpeg:
-                    jpeg_end = buffer.find(b"\xff\xd9")
+                if jpeg_start != -1 and content_length is None:
+                    jpeg_end = buffer.find(_EOI, scan_from, length)
                     if jpeg_end != -1:
                         # Extract complete JPEG frame (including FFD9 marker)
-                        jpeg_data = buffer[:jpeg_end + 2]
+                        jpeg_data = bytes(view[jpeg_start:jpeg_end + 2])
                         _LOGGER.debug("Extracted JPEG frame of %d bytes", len(jpeg_data))
                         return jpeg_data
 
-                # Safety check: if we have content length and buffer is big enough
-                if content_length and len(buffer) >= content_length + 1000:
-                    # Should have found end marker by now, try to extract what we have
-                    jpeg_end = buffer.find(b"\xff\xd9")
-                    if jpeg_end != -1:
-                        return buffer[:jpeg_end + 2]
-
-                # Prevent buffer from growing too large
-                if len(buffer) > 2 * 1024 * 1024:  # 2MB limit
-                    _LOGGER.warning("Buffer exceeded 2MB without finding complete frame")
-                    break
+                # Keep one byte of overlap in case a marker straddles two chunks
+                if jpeg_start == -1 or content_length is None:
+                    scan_from = max(scan_from, length - 1)
 
             return None
 
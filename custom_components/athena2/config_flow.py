@@ -6,7 +6,6 @@ import logging
 from typing import Any
 
 import aiohttp
-import async_timeout
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -40,10 +39,10 @@ async def validate_connection(
     url = f"http://{host}:{port}{ENDPOINT_STATUS}"
 
     try:
-        async with async_timeout.timeout(10):
-            response = await session.get(url)
-            response.raise_for_status()
-            data = await response.json()
+        async with asyncio.timeout(10):
+            async with session.get(url) as response:
+                response.raise_for_status()
+                data = await response.json()
 
             # Validate essential fields
             if "Status" not in data:
@@ -17,6 +17,7 @@ MAX_SCAN_INTERVAL: Final = 300
 DEFAULT_CAMERA_FPS: Final = 1  # 1 frame every 10 seconds
 MIN_CAMERA_FPS: Final = 0.1  # 1 frame every 10 seconds
 MAX_CAMERA_FPS: Final = 5  # 5 frames per second (near real-time)
+IDLE_ANALYTIC_POLLS: Final = 5  # Refresh analytics every 5th poll when not printing
 
 # Platforms
 PLATFORMS: Final = ["sensor", "binary_sensor", "camera"]
@@ -34,6 +35,7 @@ SERVICE_REBOOT: Final = "reboot"
 ENDPOINT_STATUS: Final = "/status"
 ENDPOINT_CAMERA: Final = "/athena-camera/stream"
 ENDPOINT_ANALYTIC_VALUE: Final = "/analytic/value"
+ENDPOINT_ANALYTIC_VALUES: Final = "/analytic/values"
 ENDPOINT_PAUSE: Final = "/printer/pause"
 ENDPOINT_UNPAUSE: Final = "/printer/unpause"
 ENDPOINT_STOP: Final = "/printer/stop"
@@ -44,36 +46,36 @@ ENDPOINT_SHUTDOWN: Final = "/printer/off"
 ENDPOINT_REBOOT: Final = "/printer/restart"
 
 # Analytic metric IDs mapping to keys
-ANALYTIC_METRICS: Final = {
-    0: "layer_height",
-    1: "solid_area",
-    2: "area_count",
-    3: "largest_area",
-    4: "speed",
-    5: "cure",
-    6: "pressure",
-    7: "temperature_inside",
-    8: "temperature_outside",
-    9: "layer_time_analytic",
-    10: "lift_height",
-    11: "temperature_mcu_analytic",
-    12: "temperature_inside_target",
-    13: "temperature_outside_target",
-    14: "temperature_mcu_target",
-    15: "mcu_fan_rpm_analytic",
-    16: "uv_fan_rpm_analytic",
-    17: "dynamic_wait",
-    18: "temperature_vat",
-    19: "temperature_vat_target",
-    20: "ptc_fan_rpm",
-    21: "aegis_fan_rpm",
-    22: "temperature_chamber",
-    23: "temperature_chamber_target",
-    24: "temperature_ptc",
-    25: "temperature_ptc_target",
-    26: "voc_inlet",
-    27: "voc_outlet",
-}
+ANALYTIC_METRICS: Final = (
+    (0, "layer_height"),
+    (1, "solid_area"),
+    (2, "area_count"),
+    (3, "largest_area"),
+    (4, "speed"),
+    (5, "cure"),
+    (6, "pressure"),
+    (7, "temperature_inside"),
+    (8, "temperature_outside"),
+    (9, "layer_time_analytic"),
+    (10, "lift_height"),
+    (11, "temperature_mcu_analytic"),
+    (12, "temperature_inside_target"),
+    (13, "temperature_outside_target"),
+    (14, "temperature_mcu_target"),
+    (15, "mcu_fan_rpm_analytic"),
+    (16, "uv_fan_rpm_analytic"),
+    (17, "dynamic_wait"),
+    (18, "temperature_vat"),
+    (19, "temperature_vat_target"),
+    (20, "ptc_fan_rpm"),
+    (21, "aegis_fan_rpm"),
+    (22, "temperature_chamber"),
+    (23, "temperature_chamber_target"),
+    (24, "temperature_ptc"),
+    (25, "temperature_ptc_target"),
+    (26, "voc_inlet"),
+    (27, "voc_outlet"),
+)
 
 # Sensor keys from API
 SENSOR_STATUS: Final = "Status"
@@ -7,12 +7,31 @@ import logging
 from typing import Any
 
 import aiohttp
-import async_timeout
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.json import json_loads
 
-from .const import ANALYTIC_METRICS, ENDPOINT_ANALYTIC_VALUE, ENDPOINT_STATUS
+from .const import (
+    ANALYTIC_METRICS,
+    DOMAIN,
+    ENDPOINT_ANALYTIC_VALUE,
+    ENDPOINT_ANALYTIC_VALUES,
+    ENDPOINT_AUTO_SHUTDOWN_DISABLE,
+    ENDPOINT_AUTO_SHUTDOWN_ENABLE,
+    ENDPOINT_PAUSE,
+    ENDPOINT_REBOOT,
+    ENDPOINT_SHUTDOWN,
+    ENDPOINT_START_PRINT,
+    ENDPOINT_STATUS,
+    ENDPOINT_STOP,
+    ENDPOINT_UNPAUSE,
+    IDLE_ANALYTIC_POLLS,
+    MANUFACTURER,
+    MODEL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +43,7 @@ class Athena2Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         self,
         hass: HomeAssistant,
         session: aiohttp.ClientSession,
+        entry_id: str,
         host: str,
         port: int,
         scan_interval: int,
@@ -31,8 +51,42 @@ class Athena2Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Initialize the coordinator."""
         self.host = host
         self.port = port
-        self._session = session
-        self._status_url = f"http://{host}:{port}{ENDPOINT_STATUS}"
+        self.session = session
+        self._device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=f"Athena II ({host})",
+            manufacturer=MANUFACTURER,
+            model=MODEL,
+        )
+
+        # URLs are fixed for the life of the entry, so build them once
+        base = f"http://{host}:{port}"
+        self._status_url = f"{base}{ENDPOINT_STATUS}"
+        self._analytic_urls = {
+            metric_id: f"{base}{ENDPOINT_ANALYTIC_VALUE}/{metric_id}"
+            for metric_id, _ in ANALYTIC_METRICS
+        }
+        self._analytic_values_url = f"{base}{ENDPOINT_ANALYTIC_VALUES}"
+        # Whether the firmware serves all analytic values at once (None = not probed yet)
+        self._supports_batch: bool | None = None
+        self._last_analytic: dict[str, Any] | None = None
+        self._idle_polls = 0
+        # Analytic keys the printer answered without a value for, as opposed
+        # to ones that merely timed out; sensor setup skips these
+        self.unsupported_analytics: set[str] = set()
+        self.urls: dict[str, str] = {
+            endpoint: f"{base}{endpoint}"
+            for endpoint in (
+                ENDPOINT_PAUSE,
+                ENDPOINT_UNPAUSE,
+                ENDPOINT_STOP,
+                ENDPOINT_AUTO_SHUTDOWN_ENABLE,
+                ENDPOINT_AUTO_SHUTDOWN_DISABLE,
+                ENDPOINT_SHUTDOWN,
+                ENDPOINT_REBOOT,
+            )
+        }
+        self.start_print_base = f"{base}{ENDPOINT_START_PRINT}"
 
         super().__init__(
             hass,
@@ -41,24 +95,37 @@ class Athena2Coordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=timedelta(seconds=scan_interval),
         )
 
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info shared by all entities of this printer."""
+        return self._device_info
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the printer."""
         try:
-            async with async_timeout.timeout(10):
-                response = await self._session.get(self._status_url)
-                response.raise_for_status()
-                data = await response.json()
+            async with asyncio.timeout(10):
+                # Release the connection before the analytic requests go out
+                async with self.session.get(self._status_url) as response:
+                    response.raise_for_status()
+                    # orjson-backed parser shipped with HA core
+                    data = await response.json(loads=json_loads)
 
                 # Validate that we have essential data
                 if "Status" not in data:
                     raise UpdateFailed("Invalid response from printer - missing Status field")
 
-                # Fetch analytic data
-                analytic_data = await self._fetch_analytic_data()
-                data.update(analytic_data)
+                # Analytic values change fastest during a print; otherwise they
+                # are refreshed every few polls (temperatures and fans still drift)
+                active = (data.get("Printing") or data.get("Paused")) and not data.get("Halted")
+                self._idle_polls = 0 if active else self._idle_polls + 1
+                if self._last_analytic is None or self._idle_polls % IDLE_ANALYTIC_POLLS == 0:
+                    self._last_analytic = await self._fetch_analytic_data()
+                data.update(self._last_analytic)
 
                 # Parse and normalize data
                 normalized_data = self._normalize_data(data)
+                self._add_print_estimates(normalized_data)
+                self._update_sw_version(normalized_data.get("Version"))
 
                 return normalized_data
 
@@ -69,52 +136,152 @@ class Athena2Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         except ValueError as err:
             raise UpdateFailed(f"Invalid JSON response from printer at {self.host}") from err
 
+    def _update_sw_version(self, version: str | None) -> None:
+        """Keep the device's firmware version in step with the printer."""
+        if version == self._device_info.get("sw_version"):
+            return
+        self._device_info["sw_version"] = version
+
+        # HA only reads device_info when entities are added, so later firmware
+        # changes have to be written to the device registry directly
+        registry = dr.async_get(self.hass)
+        if device := registry.async_get_device(identifiers=self._device_info["identifiers"]):
+            registry.async_update_device(device.id, sw_version=version)
+
     async def _fetch_analytic_data(self) -> dict[str, Any]:
         """Fetch analytic sensor values."""
+        if self._supports_batch is not False:
+            batch_data = await self._fetch_analytic_batch()
+            if batch_data is not None:
+                return batch_data
+
         analytic_data = {}
 
+        # Fetch all analytic metrics in parallel (the connector limit caps open sockets)
+        results = await asyncio.gather(
+            *(
+                self._fetch_analytic_metric(metric_id, metric_key)
+                for metric_id, metric_key in ANALYTIC_METRICS
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                _LOGGER.warning("Error fetching analytic data: %s", result)
+            elif result is not None:
+                metric_key, value = result
+                analytic_data[metric_key] = value
+
+        return analytic_data
+
+    async def _fetch_analytic_batch(self) -> dict[str, Any] | None:
+        """Fetch all analytic values in one request, if the firmware supports it."""
         try:
-            # Fetch all analytic metrics in parallel
-            for metric_id, metric_key in ANALYTIC_METRICS.items():
-                url = f"http://{self.host}:{self.port}{ENDPOINT_ANALYTIC_VALUE}/{metric_id}"
-                try:
-                    async with async_timeout.timeout(5):
-                        response = await self._session.get(url)
-                        if response.status == 200:
-                            value = await response.text()
-                            try:
-                                analytic_data[metric_key] = float(value.strip())
-                            except ValueError:
-                                _LOGGER.debug("Could not parse analytic value for %s: %s", metric_key, value)
-                except (asyncio.TimeoutError, aiohttp.ClientError) as err:
-                    _LOGGER.debug("Error fetching analytic metric %s: %s", metric_key, err)
-                    continue
-        except Exception as err:  # pylint: disable=broad-except
-            _LOGGER.warning("Error fetching analytic data: %s", err)
+            async with asyncio.timeout(5):
+                async with self.session.get(self._analytic_values_url) as response:
+                    if response.status != 200:
+                        # Until the endpoint has worked once, any other reply means
+                        # the firmware lacks it; afterwards it only skips this poll
+                        if self._supports_batch is None:
+                            self._supports_batch = False
+                        return None
+                    values = await response.json(loads=json_loads, content_type=None)
+        except (asyncio.TimeoutError, aiohttp.ClientError, ValueError) as err:
+            _LOGGER.debug("Error fetching batched analytic values: %s", err)
+            if self._supports_batch is None:
+                self._supports_batch = False
+            return None
+
+        # Accept either a list indexed by metric id or a mapping of id -> value
+        if isinstance(values, list):
+            items = dict(enumerate(values))
+        elif isinstance(values, dict):
+            items = {int(key): value for key, value in values.items() if str(key).isdigit()}
+        else:
+            items = {}
 
+        analytic_data = {}
+        for metric_id, metric_key in ANALYTIC_METRICS:
+            try:
+                analytic_data[metric_key] = float(items[metric_id])
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        if not analytic_data:
+            if self._supports_batch is None:
+                _LOGGER.debug("Batched analytic endpoint returned no usable values")
+                self._supports_batch = False
+            return None
+
+        self._supports_batch = True
+        self.unsupported_analytics = {
+            metric_key for metric_id, metric_key in ANALYTIC_METRICS if metric_id not in items
+        }
         return analytic_data
 
+    async def _fetch_analytic_metric(
+        self, metric_id: int, metric_key: str
+    ) -> tuple[str, float] | None:
+        """Fetch a single analytic sensor value."""
+        try:
+            async with asyncio.timeout(5):
+                async with self.session.get(self._analytic_urls[metric_id]) as response:
+                    if response.status != 200:
+                        self.unsupported_analytics.add(metric_key)
+                        return None
+                    value = await response.text()
+                self.unsupported_analytics.discard(metric_key)
+                try:
+                    return metric_key, float(value.strip())
+                except ValueError:
+                    _LOGGER.debug("Could not parse analytic value for %s: %s", metric_key, value)
+        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+            _LOGGER.debug("Error fetching analytic metric %s: %s", metric_key, err)
+
+        return None
+
+    def _add_print_estimates(self, data: dict[str, Any]) -> None:
+        """Add print progress and time remaining, computed once per update."""
+        layers = data.get("LayersCount") or 0
+        layer = data.get("LayerID") or 0
+        layer_time = data.get("LayerTime") or 0
+        printing = data.get("Printing")
+
+        data["_print_progress"] = (
+            round(layer / layers * 100, 1) if printing and layers > 0 else 0
+        )
+        data["_etr"] = (layers - layer) * layer_time if printing and layer_time > 0 else None
+
     def _normalize_data(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Normalize and convert units in the data."""
-        normalized = data.copy()
+        """Normalize and convert units in the data, in place.
 
+        The dict is freshly parsed from the status response on every poll, so
+        there's no need to copy it first.
+        """
         # Parse percentage strings (e.g., "49%" -> 49)
         for key in ["disk", "mem", "proc"]:
-            if key in normalized and isinstance(normalized[key], str):
+            if key in data and isinstance(data[key], str):
+                value = data[key]
+                # Slice the known suffix off instead of rstrip's per-character scan
+                if value.endswith("%"):
+                    value = value[:-1]
                 try:
-                    normalized[key] = float(normalized[key].rstrip("%"))
+                    data[key] = float(value)
                 except (ValueError, AttributeError):
-                    _LOGGER.warning("Could not parse percentage value for %s: %s", key, normalized[key])
+                    _LOGGER.warning("Could not parse percentage value for %s: %s", key, data[key])
 
         # Parse temperature string (e.g., "41.35°C" -> 41.35)
-        if "temp" in normalized and isinstance(normalized["temp"], str):
+        if "temp" in data and isinstance(data["temp"], str):
+            value = data["temp"]
+            if value.endswith("°C"):
+                value = value[:-2]  # Two code points, though three bytes in UTF-8
             try:
-                normalized["temp"] = float(normalized["temp"].rstrip("°C"))
+                data["temp"] = float(value)
             except (ValueError, AttributeError):
-                _LOGGER.warning("Could not parse temperature value: %s", normalized["temp"])
+                _LOGGER.warning("Could not parse temperature value: %s", data["temp"])
 
         # Convert CurrentHeight from micrometers to millimeters
-        if "CurrentHeight" in normalized and isinstance(normalized["CurrentHeight"], (int, float)):
-            normalized["CurrentHeight"] = normalized["CurrentHeight"] / 1000.0
+        if "CurrentHeight" in data and isinstance(data["CurrentHeight"], (int, float)):
+            data["CurrentHeight"] = data["CurrentHeight"] / 1000.0
 
-        return normalized
+        return data
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -18,16 +18,12 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import (
-    DOMAIN,
-    MANUFACTURER,
-    MODEL,
-)
+from .const import ANALYTIC_METRICS, DOMAIN
 from .coordinator import Athena2Coordinator
 
 
@@ -35,398 +31,138 @@ from .coordinator import Athena2Coordinator
 class Athena2SensorEntityDescription(SensorEntityDescription):
     """Describes Athena II sensor entity."""
 
-    value_fn: Callable[[dict[str, Any]], StateType] | None = None
+    value_key: str | None = None
     attr_fn: Callable[[dict[str, Any]], dict[str, Any]] | None = None
 
 
-SENSOR_DESCRIPTIONS: tuple[Athena2SensorEntityDescription, ...] = (
+_ANALYTIC_KEYS = frozenset(metric_key for _, metric_key in ANALYTIC_METRICS)
+
+# (device_class, native_unit_of_measurement, state_class) shared by many sensors
+_TEMP = (
+    SensorDeviceClass.TEMPERATURE,
+    UnitOfTemperature.CELSIUS,
+    SensorStateClass.MEASUREMENT,
+)
+_SECONDS = (SensorDeviceClass.DURATION, UnitOfTime.SECONDS, SensorStateClass.MEASUREMENT)
+_MILLIMETERS = (
+    SensorDeviceClass.DISTANCE,
+    UnitOfLength.MILLIMETERS,
+    SensorStateClass.MEASUREMENT,
+)
+_HOURS = (
+    SensorDeviceClass.DURATION,
+    UnitOfTime.HOURS,
+    SensorStateClass.TOTAL_INCREASING,
+)
+_RPM = (None, "RPM", SensorStateClass.MEASUREMENT)
+_PERCENT = (None, PERCENTAGE, SensorStateClass.MEASUREMENT)
+_MEASUREMENT = (None, None, SensorStateClass.MEASUREMENT)
+_TOTAL = (None, None, SensorStateClass.TOTAL)
+_TEXT = (None, None, None)
+
+# Sensors without attributes: (key, name, icon, value_key, kind)
+_SPEC: tuple[tuple[str, str, str | None, str, tuple[Any, Any, Any]], ...] = (
     # Print status sensors
-    Athena2SensorEntityDescription(
-        key="status",
-        name="Status",
-        icon="mdi:printer-3d",
-        value_fn=lambda data: data.get("Status"),
-    ),
-    Athena2SensorEntityDescription(
-        key="current_layer",
-        name="Current Layer",
-        icon="mdi:layers",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("LayerID"),
-    ),
-    Athena2SensorEntityDescription(
-        key="total_layers",
-        name="Total Layers",
-        icon="mdi:layers-triple",
-        state_class=SensorStateClass.TOTAL,
-        value_fn=lambda data: data.get("LayersCount"),
-    ),
-    Athena2SensorEntityDescription(
-        key="print_progress",
-        name="Print Progress",
-        icon="mdi:progress-clock",
-        native_unit_of_measurement=PERCENTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: (
-            round((data.get("LayerID", 0) / data.get("LayersCount", 1)) * 100, 1)
-            if data.get("LayersCount", 0) > 0 and data.get("Printing", False)
-            else 0
-        ),
-        attr_fn=lambda data: {
-            "current_layer": data.get("LayerID"),
-            "total_layers": data.get("LayersCount"),
-            "print_file": data.get("Path"),
-        },
-    ),
+    ("status", "Status", "mdi:printer-3d", "Status", _TEXT),
+    ("current_layer", "Current Layer", "mdi:layers", "LayerID", _MEASUREMENT),
+    ("total_layers", "Total Layers", "mdi:layers-triple", "LayersCount", _TOTAL),
     # Height sensors
-    Athena2SensorEntityDescription(
-        key="current_height",
-        name="Current Height",
-        icon="mdi:arrow-up-bold",
-        device_class=SensorDeviceClass.DISTANCE,
-        native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("CurrentHeight"),
-    ),
-    Athena2SensorEntityDescription(
-        key="plate_height",
-        name="Plate Height",
-        icon="mdi:arrow-collapse-down",
-        device_class=SensorDeviceClass.DISTANCE,
-        native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("PlateHeight"),
-    ),
+    ("current_height", "Current Height", "mdi:arrow-up-bold", "CurrentHeight", _MILLIMETERS),
+    ("plate_height", "Plate Height", "mdi:arrow-collapse-down", "PlateHeight", _MILLIMETERS),
     # Timing sensors
-    Athena2SensorEntityDescription(
-        key="layer_time",
-        name="Layer Time",
-        icon="mdi:timer",
-        device_class=SensorDeviceClass.DURATION,
-        native_unit_of_measurement=UnitOfTime.SECONDS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("LayerTime"),
-    ),
-    Athena2SensorEntityDescription(
-        key="prev_layer_time",
-        name="Previous Layer Time",
-        icon="mdi:timer-outline",
-        device_class=SensorDeviceClass.DURATION,
-        native_unit_of_measurement=UnitOfTime.SECONDS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("PrevLayerTime"),
-    ),
-    Athena2SensorEntityDescription(
-        key="estimated_time_remaining",
-        name="Estimated Time Remaining",
-        icon="mdi:clock-end",
-        device_class=SensorDeviceClass.DURATION,
-        native_unit_of_measurement=UnitOfTime.SECONDS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: (
-            (data.get("LayersCount", 0) - data.get("LayerID", 0)) * data.get("LayerTime", 0)
-            if data.get("Printing", False) and data.get("LayerTime", 0) > 0
-            else None
-        ),
-    ),
+    ("layer_time", "Layer Time", "mdi:timer", "LayerTime", _SECONDS),
+    ("prev_layer_time", "Previous Layer Time", "mdi:timer-outline", "PrevLayerTime", _SECONDS),
+    ("estimated_time_remaining", "Estimated Time Remaining", "mdi:clock-end", "_etr", _SECONDS),
     # Temperature sensors
-    Athena2SensorEntityDescription(
-        key="system_temp",
-        name="System Temperature",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("temp"),
-    ),
-    Athena2SensorEntityDescription(
-        key="mcu_temp",
-        name="MCU Temperature",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("mcu"),
-    ),
-    Athena2SensorEntityDescription(
-        key="resin_temp",
-        name="Resin Temperature",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("resin"),
-    ),
+    ("system_temp", "System Temperature", None, "temp", _TEMP),
+    ("mcu_temp", "MCU Temperature", None, "mcu", _TEMP),
+    ("resin_temp", "Resin Temperature", None, "resin", _TEMP),
     # Fan sensors
-    Athena2SensorEntityDescription(
-        key="mcu_fan_rpm",
-        name="MCU Fan Speed",
-        icon="mdi:fan",
-        native_unit_of_measurement="RPM",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("mcu_fan_rpm"),
-    ),
-    Athena2SensorEntityDescription(
-        key="uv_fan_rpm",
-        name="UV Fan Speed",
-        icon="mdi:fan",
-        native_unit_of_measurement="RPM",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("uv_fan_rpm"),
-    ),
+    ("mcu_fan_rpm", "MCU Fan Speed", "mdi:fan", "mcu_fan_rpm", _RPM),
+    ("uv_fan_rpm", "UV Fan Speed", "mdi:fan", "uv_fan_rpm", _RPM),
     # Resin and lamp sensors
-    Athena2SensorEntityDescription(
-        key="resin_level",
-        name="Resin Level",
-        icon="mdi:cup-water",
-        device_class=SensorDeviceClass.DISTANCE,
-        native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("ResinLevelMm"),
-    ),
-    Athena2SensorEntityDescription(
-        key="lamp_hours",
-        name="Lamp Hours",
-        icon="mdi:lightbulb-on",
-        device_class=SensorDeviceClass.DURATION,
-        native_unit_of_measurement=UnitOfTime.HOURS,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: data.get("LampHours"),
-    ),
+    ("resin_level", "Resin Level", "mdi:cup-water", "ResinLevelMm", _MILLIMETERS),
+    ("lamp_hours", "Lamp Hours", "mdi:lightbulb-on", "LampHours", _HOURS),
     # System resource sensors
-    Athena2SensorEntityDescription(
-        key="disk_usage",
-        name="Disk Usage",
-        icon="mdi:harddisk",
-        native_unit_of_measurement=PERCENTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("disk"),
-    ),
-    Athena2SensorEntityDescription(
-        key="memory_usage",
-        name="Memory Usage",
-        icon="mdi:memory",
-        native_unit_of_measurement=PERCENTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("mem"),
-    ),
-    Athena2SensorEntityDescription(
-        key="cpu_usage",
-        name="CPU Usage",
-        icon="mdi:chip",
-        native_unit_of_measurement=PERCENTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("proc"),
-    ),
-    Athena2SensorEntityDescription(
-        key="process_count",
-        name="Process Count",
-        icon="mdi:application-cog",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("proc_numb"),
-    ),
+    ("disk_usage", "Disk Usage", "mdi:harddisk", "disk", _PERCENT),
+    ("memory_usage", "Memory Usage", "mdi:memory", "mem", _PERCENT),
+    ("cpu_usage", "CPU Usage", "mdi:chip", "proc", _PERCENT),
+    ("process_count", "Process Count", "mdi:application-cog", "proc_numb", _MEASUREMENT),
     # System info sensors
-    Athena2SensorEntityDescription(
-        key="uptime",
-        name="Uptime",
-        icon="mdi:clock-outline",
-        value_fn=lambda data: data.get("uptime"),
-    ),
-    Athena2SensorEntityDescription(
-        key="hostname",
-        name="Hostname",
-        icon="mdi:network",
-        value_fn=lambda data: data.get("Hostname"),
-    ),
-    Athena2SensorEntityDescription(
-        key="ip_address",
-        name="IP Address",
-        icon="mdi:ip-network",
-        value_fn=lambda data: data.get("IP"),
-    ),
-    Athena2SensorEntityDescription(
-        key="firmware_version",
-        name="Firmware Version",
-        icon="mdi:package-variant",
-        value_fn=lambda data: data.get("Version"),
-    ),
-    Athena2SensorEntityDescription(
-        key="wifi",
-        name="WiFi",
-        icon="mdi:wifi",
-        value_fn=lambda data: data.get("Wifi"),
-    ),
+    ("uptime", "Uptime", "mdi:clock-outline", "uptime", _TEXT),
+    ("hostname", "Hostname", "mdi:network", "Hostname", _TEXT),
+    ("ip_address", "IP Address", "mdi:ip-network", "IP", _TEXT),
+    ("firmware_version", "Firmware Version", "mdi:package-variant", "Version", _TEXT),
+    ("wifi", "WiFi", "mdi:wifi", "Wifi", _TEXT),
     # Analytic sensors from /analytic/value endpoint
+    ("pressure", "Pressure", "mdi:gauge", "pressure", _MEASUREMENT),
+    ("temperature_vat", "Vat Temperature", None, "temperature_vat", _TEMP),
+    ("temperature_vat_target", "Vat Temperature Target", None, "temperature_vat_target", _TEMP),
+    ("temperature_chamber", "Chamber Temperature", None, "temperature_chamber", _TEMP),
+    (
+        "temperature_chamber_target",
+        "Chamber Temperature Target",
+        None,
+        "temperature_chamber_target",
+        _TEMP,
+    ),
+    ("temperature_inside", "Inside Temperature", None, "temperature_inside", _TEMP),
+    (
+        "temperature_inside_target",
+        "Inside Temperature Target",
+        None,
+        "temperature_inside_target",
+        _TEMP,
+    ),
+    ("temperature_outside", "Outside Temperature", None, "temperature_outside", _TEMP),
+    (
+        "temperature_outside_target",
+        "Outside Temperature Target",
+        None,
+        "temperature_outside_target",
+        _TEMP,
+    ),
+    ("temperature_ptc", "PTC Temperature", None, "temperature_ptc", _TEMP),
+    ("temperature_ptc_target", "PTC Temperature Target", None, "temperature_ptc_target", _TEMP),
+    ("ptc_fan_rpm", "PTC Fan Speed", "mdi:fan", "ptc_fan_rpm", _RPM),
+    ("aegis_fan_rpm", "AEGIS Fan Speed", "mdi:fan", "aegis_fan_rpm", _RPM),
+    ("voc_inlet", "VOC Inlet Air Quality", "mdi:air-filter", "voc_inlet", _PERCENT),
+    ("voc_outlet", "VOC Outlet Air Quality", "mdi:air-filter", "voc_outlet", _PERCENT),
+    ("lift_height", "Lift Height", "mdi:arrow-expand-vertical", "lift_height", _MILLIMETERS),
+    ("dynamic_wait", "Dynamic Wait", "mdi:timer-sand", "dynamic_wait", _SECONDS),
+    ("cure", "Cure Time", "mdi:timer", "cure", _SECONDS),
+    ("speed", "Speed", "mdi:speedometer", "speed", _MEASUREMENT),
+    ("solid_area", "Solid Area", "mdi:square", "solid_area", _MEASUREMENT),
+    ("area_count", "Area Count", "mdi:counter", "area_count", _MEASUREMENT),
+    ("largest_area", "Largest Area", "mdi:resize", "largest_area", _MEASUREMENT),
+)
+
+SENSOR_DESCRIPTIONS: Final[tuple[Athena2SensorEntityDescription, ...]] = (
+    # Print progress, computed by the coordinator
     Athena2SensorEntityDescription(
-        key="pressure",
-        name="Pressure",
-        icon="mdi:gauge",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("pressure"),
-    ),
-    Athena2SensorEntityDescription(
-        key="temperature_vat",
-        name="Vat Temperature",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("temperature_vat"),
-    ),
-    Athena2SensorEntityDescription(
-        key="temperature_vat_target",
-        name="Vat Temperature Target",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("temperature_vat_target"),
-    ),
-    Athena2SensorEntityDescription(
-        key="temperature_chamber",
-        name="Chamber Temperature",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("temperature_chamber"),
-    ),
-    Athena2SensorEntityDescription(
-        key="temperature_chamber_target",
-        name="Chamber Temperature Target",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("temperature_chamber_target"),
-    ),
-    Athena2SensorEntityDescription(
-        key="temperature_inside",
-        name="Inside Temperature",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("temperature_inside"),
-    ),
-    Athena2SensorEntityDescription(
-        key="temperature_inside_target",
-        name="Inside Temperature Target",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("temperature_inside_target"),
-    ),
-    Athena2SensorEntityDescription(
-        key="temperature_outside",
-        name="Outside Temperature",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("temperature_outside"),
-    ),
-    Athena2SensorEntityDescription(
-        key="temperature_outside_target",
-        name="Outside Temperature Target",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("temperature_outside_target"),
-    ),
-    Athena2SensorEntityDescription(
-        key="temperature_ptc",
-        name="PTC Temperature",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("temperature_ptc"),
-    ),
-    Athena2SensorEntityDescription(
-        key="temperature_ptc_target",
-        name="PTC Temperature Target",
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("temperature_ptc_target"),
-    ),
-    Athena2SensorEntityDescription(
-        key="ptc_fan_rpm",
-        name="PTC Fan Speed",
-        icon="mdi:fan",
-        native_unit_of_measurement="RPM",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("ptc_fan_rpm"),
-    ),
-    Athena2SensorEntityDescription(
-        key="aegis_fan_rpm",
-        name="AEGIS Fan Speed",
-        icon="mdi:fan",
-        native_unit_of_measurement="RPM",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("aegis_fan_rpm"),
-    ),
-    Athena2SensorEntityDescription(
-        key="voc_inlet",
-        name="VOC Inlet Air Quality",
-        icon="mdi:air-filter",
-        native_unit_of_measurement=PERCENTAGE,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("voc_inlet"),
-    ),
-    Athena2SensorEntityDescription(
-        key="voc_outlet",
-        name="VOC Outlet Air Quality",
-        icon="mdi:air-filter",
+        key="print_progress",
+        name="Print Progress",
+        icon="mdi:progress-clock",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("voc_outlet"),
-    ),
-    Athena2SensorEntityDescription(
-        key="lift_height",
-        name="Lift Height",
-        icon="mdi:arrow-expand-vertical",
-        device_class=SensorDeviceClass.DISTANCE,
-        native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("lift_height"),
-    ),
-    Athena2SensorEntityDescription(
-        key="dynamic_wait",
-        name="Dynamic Wait",
-        icon="mdi:timer-sand",
-        device_class=SensorDeviceClass.DURATION,
-        native_unit_of_measurement=UnitOfTime.SECONDS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("dynamic_wait"),
-    ),
-    Athena2SensorEntityDescription(
-        key="cure",
-        name="Cure Time",
-        icon="mdi:timer",
-        device_class=SensorDeviceClass.DURATION,
-        native_unit_of_measurement=UnitOfTime.SECONDS,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("cure"),
-    ),
-    Athena2SensorEntityDescription(
-        key="speed",
-        name="Speed",
-        icon="mdi:speedometer",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("speed"),
-    ),
-    Athena2SensorEntityDescription(
-        key="solid_area",
-        name="Solid Area",
-        icon="mdi:square",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("solid_area"),
-    ),
-    Athena2SensorEntityDescription(
-        key="area_count",
-        name="Area Count",
-        icon="mdi:counter",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("area_count"),
+        value_key="_print_progress",
+        attr_fn=lambda data: {
+            "current_layer": data.get("LayerID"),
+            "total_layers": data.get("LayersCount"),
+            "print_file": data.get("Path"),
+        },
     ),
-    Athena2SensorEntityDescription(
-        key="largest_area",
-        name="Largest Area",
-        icon="mdi:resize",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("largest_area"),
+    *(
+        Athena2SensorEntityDescription(
+            key=key,
+            name=name,
+            icon=icon,
+            device_class=device_class,
+            native_unit_of_measurement=unit,
+            state_class=state_class,
+            value_key=value_key,
+        )
+        for key, name, icon, value_key, (device_class, unit, state_class) in _SPEC
     ),
 )
 
@@ -439,15 +175,30 @@ async def async_setup_entry(
     """Set up Athena II sensor based on a config entry."""
     coordinator: Athena2Coordinator = hass.data[DOMAIN][entry.entry_id]
 
+    # Skip sensors for fields this printer doesn't serve. A status field missing
+    # from the first payload is definitive; an analytic metric only counts as
+    # missing when the printer rejected it, not when its request timed out
+    present = coordinator.data.keys()
+    unsupported = coordinator.unsupported_analytics
     async_add_entities(
-        Athena2Sensor(coordinator, entry, description)
-        for description in SENSOR_DESCRIPTIONS
+        [
+            Athena2Sensor(coordinator, entry, description)
+            for description in SENSOR_DESCRIPTIONS
+            if description.value_key in present
+            or (
+                description.value_key in _ANALYTIC_KEYS
+                and description.value_key not in unsupported
+            )
+        ]
     )
 
 
 class Athena2Sensor(CoordinatorEntity[Athena2Coordinator], SensorEntity):
     """Representation of an Athena II sensor."""
 
+    # HA's entity bases keep a __dict__, so only the fields added here get slots
+    __slots__ = ("_value_key", "_attributes_fn", "_cached_value", "_cached_attrs")
+
     entity_description: Athena2SensorEntityDescription
     _attr_has_entity_name = True
 
@@ -461,24 +212,35 @@ class Athena2Sensor(CoordinatorEntity[Athena2Coordinator], SensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": f"Athena II ({coordinator.host})",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": coordinator.data.get("Version") if coordinator.data else None,
-        }
+        self._attr_device_info = coordinator.device_info
+        # Copied off the description so each update skips that lookup
+        self._value_key = description.value_key
+        self._attributes_fn = description.attr_fn
+        self._cached_value: StateType = None
+        self._cached_attrs: dict[str, Any] | None = None
+        self._update_cached_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
+
+    def _update_cached_state(self) -> None:
+        """Compute the state and attributes once per coordinator update."""
+        data = self.coordinator.data
+
+        attr_fn = self._attributes_fn
+        self._cached_attrs = attr_fn(data) if attr_fn is not None else None
+
+        self._cached_value = data.get(self._value_key)
 
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
-        if self.entity_description.value_fn is not None:
-            return self.entity_description.value_fn(self.coordinator.data)
-        return None
+        return self._cached_value
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional attributes."""
-        if self.entity_description.attr_fn is not None:
-            return self.entity_description.attr_fn(self.coordinator.data)
-        return None
+        return self._cached_attrs